@@ -17,7 +17,7 @@ Rules implemented:
  - Card values: A=1, 2-9 face value, 10/J/Q/K=0
  - Hand total = units digit of sum (e.g., 15 -> 5)
  - Standard Punto Banco third-card rules for Player and Banker
- - Banker wins pay 95% (5% commission), Player wins pay 1:1, Tie pays 8:1
+ - Banker wins pay 95% (5% commission, rounded down), Player wins pay 1:1, Tie pays 8:1
  - Reshuffles when shoe has fewer than 6 cards remaining
 """
 
@@ -27,72 +27,75 @@ import sys
 DECKS = 8
 RESHUFFLE_THRESHOLD = 6  # reshuffle when fewer than this many cards remain
 
-def create_shoe(decks=DECKS):
-    ranks = ['A','2','3','4','5','6','7','8','9','10','J','Q','K']
-    single_deck = ranks * 4
-    shoe = single_deck * decks
-    random.shuffle(shoe)
+_RNG = random.Random()
+
+# Baccarat point value of each rank
+RANK_VALUE = {'A':1,'2':2,'3':3,'4':4,'5':5,'6':6,'7':7,'8':8,'9':9,'10':0,'J':0,'Q':0,'K':0}
+
+# Unshuffled card layouts, built once at import
+_RANKS = ('A','2','3','4','5','6','7','8','9','10','J','Q','K')
+_SINGLE_DECK = list(_RANKS) * 4
+_SHOE_TEMPLATE = _SINGLE_DECK * DECKS
+
+# Banker third-card tableau: BANKER_DRAW[bank_total][player_third_value]
+# Column 10 means the player stood (banker draws on 0-5, stands on 6-7).
+# Rows 8 and 9 are naturals and always stand.
+BANKER_DRAW = (
+    (1,)*11,                            # 0
+    (1,)*11,                            # 1
+    (1,)*11,                            # 2
+    (1,1,1,1,1,1,1,1,0,1,1),            # 3: draws unless player's third is 8
+    (0,0,1,1,1,1,1,1,0,0,1),            # 4: draws on 2-7
+    (0,0,0,0,1,1,1,1,0,0,1),            # 5: draws on 4-7
+    (0,0,0,0,0,0,1,1,0,0,0),            # 6: draws on 6-7
+    (0,)*11,                            # 7
+    (0,)*11,                            # 8
+    (0,)*11,                            # 9
+)
+
+# Net result of a bet keyed by (winner, bet_type).
+# Tie pays 8:1 (some casinos 9:1); player/banker bets push on a tie (0 = bet returned).
+# Banker wins pay 0.95 (5% commission, fractions rounded down); player wins pay 1:1.
+_PAYOFF = {
+    ('tie', 'tie'): lambda b: b * 8,
+    ('tie', 'player'): lambda b: 0,
+    ('tie', 'banker'): lambda b: 0,
+    ('player', 'player'): lambda b: b,
+    ('player', 'banker'): lambda b: -b,
+    ('player', 'tie'): lambda b: -b,
+    ('banker', 'banker'): lambda b: (b * 19) // 20,
+    ('banker', 'player'): lambda b: -b,
+    ('banker', 'tie'): lambda b: -b,
+}
+
+_RESULT_LABEL = {'player': 'PLAYER wins', 'banker': 'BANKER wins', 'tie': 'TIE'}
+
+def create_shoe(decks=DECKS, rng=_RNG):
+    # Copy the prebuilt shoe instead of rebuilding it on every reshuffle
+    shoe = _SHOE_TEMPLATE.copy() if decks == DECKS else _SINGLE_DECK * decks
+    rng.shuffle(shoe)
     return shoe
 
-def card_value(rank):
-    if rank == 'A':
-        return 1
-    if rank in ('10','J','Q','K'):
-        return 0
-    return int(rank)
-
 def hand_total(hand):
-    total = sum(card_value(c) for c in hand) % 10
-    return total
+    return sum(map(RANK_VALUE.__getitem__, hand)) % 10
 
 def draw(shoe):
     if not shoe:
         raise ValueError("The shoe is empty. Should reshuffle before drawing.")
-    return shoe.pop(0)
+    return shoe.pop()
 
 def player_draws(player_total):
     # Player draws a third card if total 0-5, stands on 6-7, natural on 8-9 handled outside
     return player_total <= 5
 
 def banker_draws(bank_total, player_third_card):
-    # If player did not draw a third card, banker draws on 0-5, stands on 6-7.
-    if player_third_card is None:
-        return bank_total <= 5
-    # If player drew a third card, use the complex rules
-    p3 = card_value(player_third_card)
-    if bank_total <= 2:
-        return True
-    if bank_total == 3:
-        return p3 != 8
-    if bank_total == 4:
-        return 2 <= p3 <= 7
-    if bank_total == 5:
-        return 4 <= p3 <= 7
-    if bank_total == 6:
-        return p3 in (6,7)
-    return False  # bank_total == 7 -> stand
+    # Banker tableau lookup; column 10 is used when the player stood.
+    p3 = 10 if player_third_card is None else RANK_VALUE[player_third_card]
+    return bool(BANKER_DRAW[bank_total][p3])
 
 def settle_bet(bet_type, bet_amount, winner):
     # winner: 'player', 'banker', 'tie'
-    if winner == 'tie':
-        if bet_type == 'tie':
-            # Tie pays 8:1 typically (some casinos 9:1) — we'll use 8:1
-            return bet_amount * 8
-        else:
-            # push for player/banker bets on tie -> return bet (no win, no loss)
-            return 0  # indicate push (handled by caller)
-    elif winner == 'player':
-        if bet_type == 'player':
-            return bet_amount  # 1:1 profit
-        elif bet_type == 'banker':
-            return -bet_amount  # lost bet
-    elif winner == 'banker':
-        if bet_type == 'banker':
-            # Banker wins pay 0.95 (5% commission)
-            return int(round(bet_amount * 0.95))
-        elif bet_type == 'player':
-            return -bet_amount
-    return -bet_amount  # default lost bet
+    return _PAYOFF[(winner, bet_type)](bet_amount)
 
 def print_hand(label, hand):
     cards = ' '.join(hand)
@@ -145,6 +148,18 @@ def play_round(shoe):
         'banker_third': banker_third
     }
 
+def simulate(num_rounds, decks=DECKS, seed=None):
+    # Play rounds with no I/O and count outcomes: {'player': n, 'banker': n, 'tie': n}
+    # Pass a seed for reproducible results.
+    rng = random.Random(seed)
+    counts = {'player': 0, 'banker': 0, 'tie': 0}
+    shoe = create_shoe(decks, rng)
+    for _ in range(num_rounds):
+        if len(shoe) < RESHUFFLE_THRESHOLD:
+            shoe = create_shoe(decks, rng)
+        counts[play_round(shoe)['winner']] += 1
+    return counts
+
 def prompt_bet(bankroll):
     while True:
         choice = input("Bet on (player/banker/tie) [p/b/t] (or 'q' to quit): ").strip().lower()
@@ -196,33 +211,23 @@ def main():
         print_hand("Banker", result['banker_hand'])
 
         winner = result['winner']
-        if winner == 'tie':
-            print("Result: TIE")
-            # Tie handling: bets on tie win 8:1, player/banker push (bet returned)
-            if bet_type == 'tie':
-                payout = settle_bet(bet_type, bet_amount, 'tie')
-                bankroll += payout
-                print(f"You won ${payout} on a tie bet!")
+        net = settle_bet(bet_type, bet_amount, winner)
+        bankroll += net
+        print(f"Result: {_RESULT_LABEL[winner]}")
+        if bet_type == winner:
+            if winner == 'tie':
+                print(f"You won ${net} on a tie bet!")
+            elif winner == 'banker' and net == 0:
+                print("Banker wins, but the 5% commission rounds your win down to $0.")
+            elif winner == 'banker':
+                print(f"You won ${net} (after 5% commission).")
             else:
-                print("Push on player/banker bet (bet returned).")
-        elif winner == 'player':
-            print("Result: PLAYER wins")
-            payout = settle_bet(bet_type, bet_amount, 'player')
-            if payout > 0:
-                bankroll += payout
-                print(f"You won ${payout}!")
-            else:
-                bankroll -= bet_amount
-                print(f"You lost ${bet_amount}.")
-        elif winner == 'banker':
-            print("Result: BANKER wins")
-            if bet_type == 'banker':
-                win = settle_bet(bet_type, bet_amount, 'banker')
-                bankroll += win
-                print(f"You won ${win} (after 5% commission).")
-            else:
-                bankroll -= bet_amount
-                print(f"You lost ${bet_amount}.")
+                print(f"You won ${net}!")
+        elif winner == 'tie':
+            # Tie handling: player/banker bets push (bet returned)
+            print("Push on player/banker bet (bet returned).")
+        else:
+            print(f"You lost ${bet_amount}.")
 
         # Prevent negative bankroll display (bankrupt)
         if bankroll <= 0:
@@ -14,56 +14,146 @@ Author: ChatGPT (GPT-5 Thinking mini)
 
 import random
 import sys
-import textwrap
 
 SUITS = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
 RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
 
-def create_deck(num_decks=6):
-    deck = []
-    for _ in range(num_decks):
-        for s in SUITS:
-            for r in RANKS:
-                deck.append((r, s))
-    random.shuffle(deck)
-    return deck
+RESHUFFLE_THRESHOLD = 15  # reshuffle when fewer than this many cards remain
+
+_RNG = random.Random()
+
+# blackjack value of each rank, aces counted as 11
+_RANK_VALUE = {'2':2,'3':3,'4':4,'5':5,'6':6,'7':7,'8':8,'9':9,'10':10,'J':10,'Q':10,'K':10,'A':11}
+
+# the 52 distinct cards, built once and shared by every shoe
+_SINGLE_DECK = tuple((r, s) for s in SUITS for r in RANKS)
+
+# display string for every card, e.g. ('10', 'Hearts') -> '10♥'
+_SUIT_SYMBOL = {'Hearts':'♥','Diamonds':'♦','Clubs':'♣','Spades':'♠'}
+CARD_STR = {(r, s): f"{r}{_SUIT_SYMBOL[s]}" for s in SUITS for r in RANKS}
+card_str = CARD_STR.__getitem__
+
+# Basic strategy for this game's rules (dealer stands on all 17s, double on any
+# first two cards, no splits). Action codes:
+STAND = 0             # stand
+HIT = 1               # hit
+DOUBLE = 2            # double, else hit
+DOUBLE_OR_STAND = 3   # double, else stand
+_CHART_CODE = {'S': STAND, 'H': HIT, 'D': DOUBLE, 'X': DOUBLE_OR_STAND}
 
-def card_str(card):
-    rank, suit = card
-    suit_symbol = {'Hearts':'♥','Diamonds':'♦','Clubs':'♣','Spades':'♠'}[suit]
-    return f"{rank}{suit_symbol}"
-
-def hand_value(hand):
-    # return (best_value, is_soft)
-    value = 0
-    aces = 0
-    for r, _ in hand:
-        if r in ['J','Q','K']:
-            value += 10
-        elif r == 'A':
-            aces += 1
-            value += 11  # count as 11 for now
+# rows are the player total, columns the dealer upcard (T = any ten)
+#        23456789TA
+_HARD_CHART = {
+     9: 'HDDDDHHHHH',
+    10: 'DDDDDDDDHH',
+    11: 'DDDDDDDDDH',
+    12: 'HHSSSHHHHH',
+    13: 'SSSSSHHHHH',
+    14: 'SSSSSHHHHH',
+    15: 'SSSSSHHHHH',
+    16: 'SSSSSHHHHH',
+}
+_SOFT_CHART = {
+    12: 'HHHHHHHHHH',
+    13: 'HHHDDHHHHH',
+    14: 'HHHDDHHHHH',
+    15: 'HHDDDHHHHH',
+    16: 'HHDDDHHHHH',
+    17: 'HDDDDHHHHH',
+    18: 'SXXXXSSHHH',
+}
+
+def _strategy_table(chart, below, above):
+    # STRATEGY[player_total][dealer_up_value], dealer_up_value 1 (ace) to 10
+    lo, hi = min(chart), max(chart)
+    table = []
+    for total in range(22):
+        if total < lo:
+            row = below * 10
+        elif total > hi:
+            row = above * 10
         else:
-            value += int(r)
-    # downgrade aces from 11 to 1 as needed
-    while value > 21 and aces:
-        value -= 10
-        aces -= 1
-    is_soft = any(r == 'A' for r, _ in hand) and value <= 21 and any(r == 'A' for r, _ in hand) and value - 10 >= 11
-    return value, is_soft
+            row = chart[total]
+        codes = [_CHART_CODE[c] for c in row]
+        table.append((STAND, codes[9], *codes[:9]))
+    return tuple(table)
+
+HARD_STRATEGY = _strategy_table(_HARD_CHART, 'H', 'S')
+SOFT_STRATEGY = _strategy_table(_SOFT_CHART, 'H', 'S')
+
+def create_deck(num_decks=6, rng=_RNG):
+    # every deck in the shoe references the same 52 card tuples
+    deck = list(_SINGLE_DECK) * num_decks
+    rng.shuffle(deck)
+    return deck
+
+class Shoe:
+    """Shuffled cards dealt by advancing a cursor instead of popping the list."""
+    __slots__ = ('cards', 'idx', 'rng')
+
+    def __init__(self, num_decks=6, rng=_RNG):
+        self.cards = create_deck(num_decks, rng)
+        self.idx = 0
+        self.rng = rng
+
+    def draw(self):
+        card = self.cards[self.idx]
+        self.idx += 1
+        return card
+
+    def reshuffle(self):
+        # reuse the same list; every card goes back into the shoe
+        self.rng.shuffle(self.cards)
+        self.idx = 0
+
+    def __len__(self):
+        return len(self.cards) - self.idx
+
+class Hand:
+    """Cards in a hand plus a running total that is updated as cards are added."""
+    __slots__ = ('cards', 'value', 'aces')
+
+    def __init__(self, cards=()):
+        self.cards = []
+        self.value = 0
+        self.aces = 0  # aces currently counted as 11
+        for card in cards:
+            self.add(card)
+
+    def add(self, card):
+        r = card[0]
+        self.cards.append(card)
+        self.value += _RANK_VALUE[r]  # aces count as 11 for now
+        self.aces += (r == 'A')
+        # downgrade aces from 11 to 1 as needed
+        while self.value > 21 and self.aces:
+            self.value -= 10
+            self.aces -= 1
+
+    @property
+    def is_soft(self):
+        return self.aces > 0
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def __getitem__(self, i):
+        return self.cards[i]
 
 def is_blackjack(hand):
-    v, _ = hand_value(hand)
-    return v == 21 and len(hand) == 2
+    return hand.value == 21 and len(hand) == 2
 
 def display_hands(player_hand, dealer_hand, hide_dealer_card=True):
-    ph = ' '.join(card_str(c) for c in player_hand)
+    ph = ' '.join(map(card_str, player_hand))
     if hide_dealer_card:
         dh = f"{card_str(dealer_hand[0])} ??"
     else:
-        dh = ' '.join(card_str(c) for c in dealer_hand)
+        dh = ' '.join(map(card_str, dealer_hand))
     print(f"\nDealer: {dh}")
-    print(f"You:    {ph}  ({hand_value(player_hand)[0]})\n")
+    print(f"You:    {ph}  ({player_hand.value})\n")
 
 def take_bet(balance):
     while True:
@@ -83,46 +173,74 @@ def take_bet(balance):
         except ValueError:
             print("Enter a valid number (or 'q' to quit).")
 
-def player_turn(deck, hand, dealer_upcard, can_double):
+def prompt_action(hand, dealer_upcard, can_double):
+    # interactive get_action: show the hand and ask for 'hit', 'stand' or 'double'
+    display_hands(hand, [dealer_upcard], hide_dealer_card=True)  # only show dealer upcard
+    options = ['(H)it', '(S)tand']
+    if can_double:
+        options.append('(D)ouble down')
     while True:
-        value, _ = hand_value(hand)
-        if value > 21:
-            print("You busted!")
-            return 'bust', hand
-        options = ['(H)it', '(S)tand']
-        if can_double and len(hand) == 2:
-            options.append('(D)ouble down')
         print("Options: " + ' / '.join(options))
         choice = input("Choose: ").strip().lower()
         if choice in ('h','hit'):
-            hand.append(deck.pop())
-            display_hands(hand, [dealer_upcard], hide_dealer_card=True)  # only show dealer upcard
-            continue
+            return 'hit'
         elif choice in ('s','stand'):
-            return 'stand', hand
-        elif choice in ('d','double','double down') and can_double and len(hand) == 2:
-            return 'double', hand
+            return 'stand'
+        elif choice in ('d','double','double down') and can_double:
+            return 'double'
         else:
             print("Invalid choice. Try again.")
 
+def stand_on_17(hand, dealer_upcard, can_double):
+    # batch get_action that mimics the dealer
+    return 'hit' if hand.value < 17 else 'stand'
+
+def decide(player_value, dealer_up_value, is_soft):
+    # basic strategy action code; dealer_up_value counts an ace as 1
+    table = SOFT_STRATEGY if is_soft else HARD_STRATEGY
+    return table[player_value][dealer_up_value]
+
+def basic_strategy(hand, dealer_upcard, can_double):
+    # batch get_action that plays basic strategy
+    r = dealer_upcard[0]
+    up = 1 if r == 'A' else _RANK_VALUE[r]
+    action = decide(hand.value, up, hand.is_soft)
+    if action == HIT:
+        return 'hit'
+    if action == STAND:
+        return 'stand'
+    if can_double:
+        return 'double'
+    return 'hit' if action == DOUBLE else 'stand'
+
+def player_turn(deck, hand, dealer_upcard, can_double, get_action):
+    # returns 'bust', 'stand' or 'double'; get_action(hand, dealer_upcard, can_double) picks each move
+    while hand.value <= 21:
+        action = get_action(hand, dealer_upcard, can_double and len(hand) == 2)
+        if action == 'hit':
+            hand.add(deck.draw())
+            continue
+        if action == 'double':
+            # take one card, then stand
+            hand.add(deck.draw())
+            return 'double'
+        return 'stand'
+    return 'bust'
+
 def dealer_turn(deck, hand):
     # Dealer hits until 17 or higher; typical rule: dealer hits soft 16 and stands on soft 17.
-    while True:
-        value, is_soft = hand_value(hand)
-        if value < 17:
-            hand.append(deck.pop())
-            continue
-        # if value == 17 and is_soft: many casinos stand on soft 17; we'll stand on all 17s.
-        break
+    # Many casinos stand on soft 17; we'll stand on all 17s.
+    while hand.value < 17:
+        hand.add(deck.draw())
     return hand
 
-def settle_bet(player_hand, dealer_hand, bet):
-    pv, _ = hand_value(player_hand)
-    dv, _ = hand_value(dealer_hand)
+def settle_bet(player_hand, dealer_hand, bet, player_natural, dealer_natural):
+    pv = player_hand.value
+    dv = dealer_hand.value
     # check for blackjack
-    if is_blackjack(player_hand) and not is_blackjack(dealer_hand):
+    if player_natural and not dealer_natural:
         return bet * 1.5  # player wins 3:2 (profit)
-    if is_blackjack(player_hand) and is_blackjack(dealer_hand):
+    if player_natural and dealer_natural:
         return 0  # push
     if pv > 21:
         return -bet
@@ -134,13 +252,13 @@ def settle_bet(player_hand, dealer_hand, bet):
         return -bet
     return 0  # push
 
-def print_round_result(player_hand, dealer_hand, bet, net):
-    pv, _ = hand_value(player_hand)
-    dv, _ = hand_value(dealer_hand)
+def print_round_result(player_hand, dealer_hand, bet, net, player_natural, dealer_natural):
+    pv = player_hand.value
+    dv = dealer_hand.value
     print("\nFinal hands:")
-    print("Dealer:", ' '.join(card_str(c) for c in dealer_hand), f"({dv})")
-    print("You:   ", ' '.join(card_str(c) for c in player_hand), f"({pv})")
-    if is_blackjack(player_hand) and not is_blackjack(dealer_hand):
+    print("Dealer:", ' '.join(map(card_str, dealer_hand)), f"({dv})")
+    print("You:   ", ' '.join(map(card_str, player_hand)), f"({pv})")
+    if player_natural and not dealer_natural:
         print(f"You got a Blackjack! You win ${bet * 1.5:.2f}.")
     elif net > 0:
         print(f"You win ${net:.2f}!")
@@ -149,67 +267,80 @@ def print_round_result(player_hand, dealer_hand, bet, net):
     else:
         print("Push (tie).")
 
+def play_round_core(deck, bet, get_action, can_double=True):
+    # Play one hand with no I/O; player decisions come from get_action.
+    # initial deal
+    player_hand = Hand((deck.draw(), deck.draw()))
+    dealer_hand = Hand((deck.draw(), deck.draw()))
+    # naturals only exist on the initial two cards, so evaluate them once
+    player_natural = is_blackjack(player_hand)
+    dealer_natural = is_blackjack(dealer_hand)
+    action = None
+    if not (player_natural or dealer_natural):
+        action = player_turn(deck, player_hand, dealer_hand[0], can_double, get_action)
+        if action == 'double':
+            bet *= 2
+        if player_hand.value <= 21:
+            dealer_turn(deck, dealer_hand)
+    return {
+        'player_hand': player_hand,
+        'dealer_hand': dealer_hand,
+        'player_natural': player_natural,
+        'dealer_natural': dealer_natural,
+        'action': action,
+        'bet': bet,
+        'net': settle_bet(player_hand, dealer_hand, bet, player_natural, dealer_natural),
+    }
+
 def play_round(deck, balance):
-    if len(deck) < 15:
+    if len(deck) < RESHUFFLE_THRESHOLD:
         print("Reshuffling the shoe...")
-        deck[:] = create_deck()
+        deck.reshuffle()
     bet = take_bet(balance)
     if bet is None:
         return None, balance, False  # signal quit
-    # initial deal
-    player_hand = [deck.pop(), deck.pop()]
-    dealer_hand = [deck.pop(), deck.pop()]
-    display_hands(player_hand, dealer_hand, hide_dealer_card=True)
-    # check naturals
-    if is_blackjack(player_hand) or is_blackjack(dealer_hand):
-        display_hands(player_hand, dealer_hand, hide_dealer_card=False)
-        net = settle_bet(player_hand, dealer_hand, bet)
-        balance += net
-        print_round_result(player_hand, dealer_hand, bet, net)
-        return True, balance, True
-    # player's turn
-    action, _ = player_turn(deck, player_hand, dealer_hand[0], can_double=True)
-    if action == 'bust':
-        net = -bet
-        balance += net
-        print_round_result(player_hand, dealer_hand, bet, net)
-        return True, balance, True
-    elif action == 'double':
-        # take one card, double bet, then stand
-        if bet * 2 > balance:
-            print("You don't have enough to double. Continuing as a hit.")
-            player_hand.append(deck.pop())
-        else:
-            balance -= bet  # take extra bet upfront
-            bet *= 2
-            player_hand.append(deck.pop())
-            print("After doubling, your hand:")
+    # doubling is only offered when the balance covers the second bet
+    result = play_round_core(deck, bet, prompt_action, can_double=bet * 2 <= balance)
+    player_hand = result['player_hand']
+    dealer_hand = result['dealer_hand']
+    if result['action'] == 'double':
+        print("After doubling, your hand:")
+        display_hands(player_hand, dealer_hand, hide_dealer_card=True)
+    if player_hand.value > 21:
+        if result['action'] == 'bust':
+            # show the card that busted the hand, as after any other hit
             display_hands(player_hand, dealer_hand, hide_dealer_card=True)
-        # check bust
-        if hand_value(player_hand)[0] > 21:
-            net = -bet
-            balance += net
-            print_round_result(player_hand, dealer_hand, bet, net)
-            return True, balance, True
-    # stand -> dealer's turn
-    dealer_hand = dealer_turn(deck, dealer_hand)
-    display_hands(player_hand, dealer_hand, hide_dealer_card=False)
-    net = settle_bet(player_hand, dealer_hand, bet)
-    balance += net
-    print_round_result(player_hand, dealer_hand, bet, net)
-    return True, balance, True
+        print("You busted!")
+    else:
+        display_hands(player_hand, dealer_hand, hide_dealer_card=False)
+    print_round_result(player_hand, dealer_hand, result['bet'], result['net'],
+                       result['player_natural'], result['dealer_natural'])
+    return True, balance + result['net'], True
+
+def simulate(num_rounds, get_action=stand_on_17, bet=1, num_decks=6, seed=None):
+    # Play rounds with no I/O and return the total net result.
+    # Pass a seed for reproducible results.
+    deck = Shoe(num_decks, random.Random(seed))
+    net = 0
+    for _ in range(num_rounds):
+        if len(deck) < RESHUFFLE_THRESHOLD:
+            deck.reshuffle()
+        net += play_round_core(deck, bet, get_action)['net']
+    return net
+
+_WELCOME = """
+Welcome to Terminal Blackjack!
+Rules:
+ - Blackjack pays 3:2.
+ - Dealer stands on all 17s.
+ - You can double down on your first two cards (one card dealt), if you have the money.
+ - Enter 'q' for bets to quit the game.
+"""
 
 def main():
-    print(textwrap.dedent("""
-    Welcome to Terminal Blackjack!
-    Rules:
-     - Blackjack pays 3:2.
-     - Dealer stands on all 17s.
-     - You can double down on your first two cards (one card dealt), if you have the money.
-     - Enter 'q' for bets to quit the game.
-    """))
+    print(_WELCOME)
     balance = 100.0
-    deck = create_deck()
+    deck = Shoe()
     while True:
         cont, balance, played = play_round(deck, balance)
         if cont is None:
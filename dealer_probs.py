@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Exact dealer outcome probabilities for Terminal Blackjack
+
+How to run:
+    python3 dealer_probs.py
+
+The dealer follows blackjack.py: hit below 17, stand on all 17s.
+Shoe compositions are 10-length tuples of card counts, index 0 = ace,
+index 1 = two, ..., index 9 = ten-valued cards (10/J/Q/K).
+
+Every (dealer hand, remaining composition) state is cached, so repeated
+queries for the same upcard and shoe, and the many sub-hands they share,
+are only enumerated once.
+"""
+
+from functools import lru_cache
+
+OUTCOMES = (17, 18, 19, 20, 21, 'bust')
+
+def shoe_composition(num_decks=6):
+    # card counts for a full shoe: 4 of each rank per deck, 16 ten-valued
+    return (4 * num_decks,) * 9 + (16 * num_decks,)
+
+def remove_card(comp, value):
+    # composition with one card of the given value (ace = 1) taken out
+    i = value - 1
+    if comp[i] <= 0:
+        raise ValueError(f"No card of value {value} left in the composition.")
+    return comp[:i] + (comp[i] - 1,) + comp[i + 1:]
+
+@lru_cache(maxsize=None)
+def _stand_distribution(hard, has_ace, comp):
+    # probabilities aligned with OUTCOMES for a dealer hand with hard total `hard`
+    best = hard + 10 if has_ace and hard + 10 <= 21 else hard
+    if hard > 21:
+        return (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+    if best >= 17:
+        dist = [0.0] * 6
+        dist[best - 17] = 1.0
+        return tuple(dist)
+    n = sum(comp)
+    if n == 0:
+        raise ValueError("The composition ran out of cards before the dealer finished.")
+    dist = [0.0] * 6
+    for i, count in enumerate(comp):
+        if not count:
+            continue
+        value = i + 1
+        p = count / n
+        sub = _stand_distribution(hard + value, has_ace or value == 1,
+                                  comp[:i] + (count - 1,) + comp[i + 1:])
+        for k in range(6):
+            dist[k] += p * sub[k]
+    return tuple(dist)
+
+def dealer_value_distribution(upcard_value, comp_tuple):
+    # upcard_value counts an ace as 1; comp_tuple is the shoe without the upcard
+    return _stand_distribution(upcard_value, upcard_value == 1, tuple(comp_tuple))
+
+def main():
+    comp = shoe_composition()
+    print("Dealer final totals, fresh 6-deck shoe (stands on all 17s)\n")
+    print("Up   " + ''.join(f"{o:>8}" for o in OUTCOMES))
+    for up in (2, 3, 4, 5, 6, 7, 8, 9, 10, 1):
+        dist = dealer_value_distribution(up, remove_card(comp, up))
+        label = 'A' if up == 1 else str(up)
+        print(f"{label:<5}" + ''.join(f"{p:>8.4f}" for p in dist))
+
+if __name__ == '__main__':
+    main()